@@ -1 +1 @@
-from .utilities import generate_tone, compute_phase_spectrum, compute_group_delay
+from .utilities import generate_tone, compute_phase_spectrum, compute_phase_spectrum_batch, compute_group_delay
@@ -1,5 +1,236 @@
+import bisect
+import os
+import threading
+from functools import lru_cache
+from types import SimpleNamespace
+
 import numpy as np
-from scipy.signal import savgol_filter
+from numba import njit, prange, vectorize
+from scipy.fft import next_fast_len, rfft, rfftfreq
+from scipy.ndimage import convolve1d
+from scipy.signal import oaconvolve, savgol_coeffs
+
+try:
+    import pyfftw
+except ImportError:  # optional: fall back to scipy.fft
+    pyfftw = None
+
+
+# --- Helper: Vectorized unwrap along the last axis ---
+def _unwrap_np(phase):
+    """
+    Unwrap phase along the last axis (same result as np.unwrap(phase, axis=-1)).
+
+    Pure numpy for N-d input: every step writes into one working buffer
+    via out= instead of allocating a temporary per step.
+    """
+    two_pi = 2 * np.pi
+    d = np.empty_like(phase)
+    d[..., 0] = 0
+    np.subtract(phase[..., 1:], phase[..., :-1], out=d[..., 1:])
+    # Correction per step: -2π * round(Δφ / 2π), accumulated along the axis
+    np.divide(d, two_pi, out=d)
+    np.round(d, out=d)
+    np.multiply(d, -two_pi, out=d)
+    np.cumsum(d, axis=-1, out=d)
+    np.add(phase, d, out=d)
+    return d
+
+
+# --- Kernel: Fused angle + unwrap ---
+@njit(cache=True, fastmath=True)
+def _angle_unwrap(X, out):
+    """
+    Write the unwrapped phase of the complex spectrum X into out.
+
+    Same result as np.unwrap(np.angle(X)), computed in one pass without
+    the intermediate wrapped-phase array.
+    """
+    two_pi = 2 * np.pi
+    offset = 0.0
+    prev = 0.0
+    for i in range(X.size):
+        cur = np.arctan2(X[i].imag, X[i].real)
+        if i > 0:
+            offset -= two_pi * np.round((cur - prev) / two_pi)
+        prev = cur
+        out[i] = cur + offset
+
+
+# --- Kernel: Fused angle + unwrap + derivative ---
+@njit(cache=True, fastmath=True)
+def _phase_group_delay(X, scale, out):
+    """
+    Write scale * dφ/dk into out, where φ is the unwrapped phase of X and k
+    the bin index (central differences inside, one-sided at the ends).
+
+    One streaming pass over X: the unwrapped phase is never stored, only
+    the last two values are kept. X must have at least 2 bins.
+    """
+    two_pi = 2 * np.pi
+    n = X.size
+    offset = 0.0
+    raw_prev = np.arctan2(X[0].imag, X[0].real)
+    p_prev2 = 0.0  # φ[i-2]
+    p_prev = raw_prev  # φ[i-1]
+    for i in range(1, n):
+        raw = np.arctan2(X[i].imag, X[i].real)
+        offset -= two_pi * np.round((raw - raw_prev) / two_pi)
+        raw_prev = raw
+        p = raw + offset
+        if i == 1:
+            out[0] = (p - p_prev) * scale
+        else:
+            out[i - 1] = (p - p_prev2) * (0.5 * scale)
+        p_prev2 = p_prev
+        p_prev = p
+    out[n - 1] = (p_prev - p_prev2) * scale
+
+
+# --- Kernel: Squared magnitude ---
+@vectorize(["float32(complex64)", "float64(complex128)"], nopython=True, cache=True)
+def _abs2(z):
+    """|z|² without the square root taken by np.abs."""
+    return z.real * z.real + z.imag * z.imag
+
+
+# --- Kernel: Recursive sine oscillator ---
+@njit(cache=True)
+def _osc(omega, N, amplitude):
+    """
+    N samples of amplitude * sin(omega * n) via the two-term recurrence
+    y[n] = 2cos(ω)·y[n-1] - y[n-2] (one multiply and one subtract per sample).
+    """
+    signal = np.empty(N)
+    c = 2 * np.cos(omega)
+    y0 = -np.sin(omega)  # y[-1]
+    y1 = 0.0  # y[0]
+    for n in range(N):
+        signal[n] = amplitude * y1
+        y = c * y1 - y0
+        y0 = y1
+        y1 = y
+    return signal
+
+
+# --- Helper: Cached FFT frequency bins ---
+@lru_cache(maxsize=16)
+def _freqs(N, sr):
+    """
+    Frequency bins (Hz) of an N-point rfft at sample rate sr.
+
+    Cached per (N, sr), so the array is shared between calls and marked
+    read-only. Copy it before modifying.
+    """
+    freqs = rfftfreq(N, d=1 / sr)
+    freqs.setflags(write=False)
+    return freqs
+
+
+# --- Helper: Per-thread scratch buffers ---
+_SCRATCH = threading.local()
+_SCRATCH_SIZES = 4  # distinct (N, dtype) entries kept per thread
+
+
+def _get_scratch(N, dtype):
+    """
+    Per-thread scratch space for an N-sample signal of the given dtype.
+
+    Holds `mag` and `phase` arrays of N//2 + 1 bins and, once _rfft has seen
+    length N twice, the pyFFTW `plan` for it. Entries are reused while N and dtype
+    stay the same; only for intermediates that never leave the calling
+    function.
+    """
+    cache = getattr(_SCRATCH, 'cache', None)
+    if cache is None:
+        cache = _SCRATCH.cache = {}
+    key = (N, np.dtype(dtype))
+    scratch = cache.pop(key, None)
+    if scratch is None:
+        if len(cache) >= _SCRATCH_SIZES:
+            cache.pop(next(iter(cache)))  # least recently used
+        n_bins = N // 2 + 1
+        scratch = SimpleNamespace(
+            mag=np.empty(n_bins, dtype=dtype),
+            phase=np.empty(n_bins, dtype=dtype),
+            plan=None,
+            fft_seen=False,
+        )
+    cache[key] = scratch
+    return scratch
+
+
+# --- Helper: Planned real FFT ---
+def _rfft(audio, n):
+    """
+    n-point real FFT of a 1-D float32/float64 signal (complex64/complex128
+    output), zero-padding audio if it is shorter than n.
+
+    Uses scipy.fft.rfft on all cores, switching to a per-thread pyFFTW plan
+    (when pyfftw is installed) once a length comes up a second time, so a
+    one-off call never pays for planning. Lengths with large prime factors
+    always go to scipy, which handles them faster. With pyFFTW the result is the
+    plan's output buffer, overwritten by the next call on the same thread.
+    """
+    if pyfftw is None or n != next_fast_len(n, real=True):
+        return rfft(audio, n=n, workers=-1)
+    scratch = _get_scratch(n, audio.dtype)
+    if not scratch.fft_seen:
+        scratch.fft_seen = True
+        return rfft(audio, n=n, workers=-1)
+    if scratch.plan is None:
+        # FFTW_ESTIMATE plans in about a millisecond; FFTW_MEASURE can take
+        # seconds at a new length
+        a = pyfftw.empty_aligned(n, dtype=audio.dtype)
+        scratch.plan = pyfftw.builders.rfft(
+            a, threads=os.cpu_count(), planner_effort='FFTW_ESTIMATE'
+        )
+    buf = scratch.plan.input_array
+    np.copyto(buf[:len(audio)], audio)
+    buf[len(audio):] = 0
+    return scratch.plan()
+
+
+# --- Helper: Savitzky-Golay smoothing with cached coefficients ---
+@lru_cache(maxsize=32)
+def _savgol_kernels(window_length, polyorder):
+    """
+    Cached Savitzky-Golay smoothing coefficients plus the two matrices that
+    map the first / last window onto its fitted edge values.
+    """
+    coeffs = savgol_coeffs(window_length, polyorder)
+    # Least-squares polynomial fit over one window, evaluated at every point
+    V = np.vander(np.arange(window_length, dtype=np.float64), polyorder + 1)
+    fit = V @ np.linalg.pinv(V)
+    halflen = window_length // 2
+    return coeffs, fit[:halflen], fit[window_length - halflen:]
+
+
+def _savgol_smooth(x, window_length, polyorder):
+    """
+    Same result as scipy.signal.savgol_filter(x, window_length, polyorder)
+    (mode='interp') for 1-D x, without recomputing the filter per call.
+    Long inputs are convolved with overlap-add FFT convolution.
+    """
+    if window_length > x.size:
+        raise ValueError("If mode is 'interp', window_length must be less "
+                         "than or equal to the size of x.")
+    coeffs, head, tail = _savgol_kernels(window_length, polyorder)
+    halflen = window_length // 2
+
+    if x.size > 10_000:
+        # Match the coefficients' precision to x so float32 input stays float32.
+        # Slice the full convolution at convolve1d's origin (halflen), which
+        # also lines up even-length windows
+        y = oaconvolve(x, coeffs.astype(x.dtype, copy=False), mode='full')
+        y = y[halflen:halflen + x.size]
+    else:
+        y = convolve1d(x, coeffs, mode='constant')
+
+    # Edges: use the polynomial fitted to the first / last window
+    y[:halflen] = head @ x[:window_length]
+    y[x.size - halflen:] = tail @ x[x.size - window_length:]
+    return y
 
 
 # --- Function: Pure sine wave generator ---
@@ -12,17 +243,28 @@ def generate_tone(freq, duration, sr=16000, amplitude=0.5):
     - f = Frequency in Hz (e.g., 150 Hz = 150 cycles per second)
     - t = time array from 0 to duration
 
+    For scalar freq and amplitude the samples are generated with a recursive
+    oscillator instead of calling sin() per sample: with ω = 2π*f/sr,
+      y[n] = 2cos(ω)*y[n-1] - y[n-2]
+    Array freq or amplitude (e.g. an envelope) are broadcast against t as usual.
+
     Returns:
       t: time array (used for plotting)
       signal: the actual waveform (numpy array of audio samples)
     """
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-    signal = amplitude * np.sin(2 * np.pi * freq * t)
+    N = int(sr * duration)
+    dt = duration / N if N else 0.0
+    t = np.arange(N, dtype=np.float64) * dt
+    if np.ndim(freq) == 0 and np.ndim(amplitude) == 0:
+        signal = _osc(2 * np.pi * freq * dt, N, amplitude)
+    else:
+        signal = amplitude * np.sin(2 * np.pi * freq * t)
     return t, signal
 
 
 # --- Function: Phase Spectrum Computation ---
-def compute_phase_spectrum(audio, sr, unwrap=True, mask_threshold=None):
+def compute_phase_spectrum(audio, sr, unwrap=True, mask_threshold=None, return_magnitude=True,
+                           pad_to_fast_len=True, dtype=np.float64):
     """
     Compute the phase spectrum of an audio signal using FFT.
 
@@ -38,6 +280,17 @@ def compute_phase_spectrum(audio, sr, unwrap=True, mask_threshold=None):
     mask_threshold : float or None
         If provided, mask phase values where magnitude is below this threshold
         (useful to focus on strong frequency components)
+    return_magnitude : bool
+        If False, the magnitude spectrum is not computed and None is returned
+        in its place
+    pad_to_fast_len : bool
+        If True, zero-pad the audio to the next FFT-friendly length (see
+        scipy.fft.next_fast_len), which can be several times faster. The
+        frequency bins then follow the padded length; set False to analyse
+        at exactly len(audio) points
+    dtype : numpy dtype
+        Working precision (np.float64 or np.float32). float32 halves the
+        memory traffic and is plenty for visualization
 
     Returns:
     --------
@@ -45,8 +298,8 @@ def compute_phase_spectrum(audio, sr, unwrap=True, mask_threshold=None):
         Frequency bins in Hz
     phase : numpy array
         Phase spectrum in radians (wrapped or unwrapped)
-    magnitude : numpy array
-        Magnitude spectrum (for reference)
+    magnitude : numpy array or None
+        Magnitude spectrum (for reference), None if return_magnitude is False
 
     Notes:
     ------
@@ -55,27 +308,87 @@ def compute_phase_spectrum(audio, sr, unwrap=True, mask_threshold=None):
     - Unwrapping: If phase jumps by more than π, assume it's a wrap and add/subtract 2π
       Formula: φ_unwrap(k) = φ(k) + 2π*n_k
     """
-    N = len(audio)
-    X = np.fft.rfft(audio)
-    freqs = np.fft.rfftfreq(N, d=1 / sr)
+    audio = np.asarray(audio, dtype=dtype)
+    N = next_fast_len(len(audio), real=True) if pad_to_fast_len else len(audio)
+    X = _rfft(audio, N)
+    freqs = _freqs(N, sr)
 
-    magnitude = np.abs(X)
+    magnitude = None
+    if mask_threshold is not None:
+        # Compare |X|² against threshold² (clamped so negative thresholds
+        # still mask nothing); the root is only taken if magnitude is returned
+        if return_magnitude:
+            mag2 = _abs2(X)
+        else:
+            mag2 = _abs2(X, out=_get_scratch(N, dtype).mag)
+        mask = mag2 < max(mask_threshold, 0) ** 2
+        if return_magnitude:
+            magnitude = np.sqrt(mag2, out=mag2)
+    elif return_magnitude:
+        magnitude = np.abs(X)
 
+    # phase is returned to the caller, so it gets its own array
+    phase = np.empty(X.size, dtype=dtype)
     if unwrap:
-        phase = np.unwrap(np.angle(X))
+        _angle_unwrap(X, phase)
     else:
-        phase = np.angle(X)
+        np.arctan2(X.imag, X.real, out=phase)
 
     if mask_threshold is not None:
-        phase_masked = phase.copy()
-        phase_masked[magnitude < mask_threshold] = np.nan
-        phase = phase_masked
+        np.copyto(phase, np.nan, where=mask)
+
+    return freqs, phase, magnitude
+
+
+# --- Function: Batched Phase Spectrum Computation ---
+def compute_phase_spectrum_batch(audio, sr, unwrap=True, mask_threshold=None, dtype=np.float32):
+    """
+    Compute the phase spectrum of many equal-length frames at once.
+
+    Same as compute_phase_spectrum applied to each row, but with a single
+    multi-threaded FFT call over the whole batch.
+
+    Parameters:
+    -----------
+    audio : numpy array, shape (K, N)
+        K audio frames of N samples each (frames along the leading axis)
+    sr : int
+        Sample rate in Hz
+    unwrap : bool
+        If True, unwrap phase along frequency for every frame
+    mask_threshold : float or None
+        If provided, mask phase values where magnitude is below this threshold
+    dtype : numpy dtype
+        Working precision (np.float32 or np.float64)
+
+    Returns:
+    --------
+    freqs : numpy array, shape (N//2 + 1,)
+        Frequency bins in Hz
+    phase : numpy array, shape (K, N//2 + 1)
+        Phase spectrum in radians per frame
+    magnitude : numpy array, shape (K, N//2 + 1)
+        Magnitude spectrum per frame
+    """
+    audio = np.asarray(audio, dtype=dtype)
+    N = audio.shape[-1]
+    X = rfft(audio, axis=-1, workers=-1)
+    freqs = _freqs(N, sr)
+
+    magnitude = np.abs(X)
+    phase = np.angle(X)
+    if unwrap:
+        phase = _unwrap_np(phase)
+
+    if mask_threshold is not None:
+        np.copyto(phase, np.nan, where=magnitude < mask_threshold)
 
     return freqs, phase, magnitude
 
 
 # --- Function: Group Delay Computation ---
-def compute_group_delay(audio, sr, smooth_phase=True, window_length=101, polyorder=3):
+def compute_group_delay(audio, sr, smooth_phase=True, window_length=101, polyorder=3,
+                        pad_to_fast_len=True, dtype=np.float64):
     """
     Compute group delay of an audio signal from its phase spectrum.
 
@@ -92,6 +405,11 @@ def compute_group_delay(audio, sr, smooth_phase=True, window_length=101, polyord
         Window length for Savitzky-Golay filter (must be odd)
     polyorder : int
         Polynomial order for Savitzky-Golay filter
+    pad_to_fast_len : bool
+        If True, zero-pad the audio to the next FFT-friendly length
+        (see compute_phase_spectrum)
+    dtype : numpy dtype
+        Working precision (np.float64 or np.float32)
 
     Returns:
     --------
@@ -109,106 +427,210 @@ def compute_group_delay(audio, sr, smooth_phase=True, window_length=101, polyord
     - Best used for comparing two audio files (clean vs processed)
     - For signals (not systems), group delay shows timing estimate reliability at each frequency
     """
-    N = len(audio)
-    X = np.fft.rfft(audio)
-    freqs = np.fft.rfftfreq(N, d=1 / sr)
+    audio = np.asarray(audio, dtype=dtype)
+    N = next_fast_len(len(audio), real=True) if pad_to_fast_len else len(audio)
+    X = _rfft(audio, N)
+    freqs = _freqs(N, sr)
+
+    if X.size < 2:
+        raise ValueError("At least 2 frequency bins are required to compute group delay.")
 
-    phase = np.unwrap(np.angle(X))
+    # Bins are uniformly spaced (df = sr/N), so the derivative w.r.t.
+    # frequency is taken with central differences inside and one-sided ones
+    # at the ends (as np.gradient does), folded into the group delay scaling
+    df = sr / N
+    scale = -1.0 / (2 * np.pi * df)
+    group_delay = np.empty(X.size, dtype=dtype)
 
-    if smooth_phase:
-        phase = savgol_filter(phase, window_length, polyorder)
+    if not smooth_phase:
+        # Angle, unwrap, derivative and scaling in a single pass over X
+        _phase_group_delay(X, scale, group_delay)
+        return freqs, group_delay
 
-    # Numerical derivative of phase w.r.t frequency
-    dphi_df = np.gradient(phase, freqs)
+    # Unwrapped phase, written into this thread's scratch buffer
+    phase = _get_scratch(N, dtype).phase
+    _angle_unwrap(X, phase)
+    phase = _savgol_smooth(phase, window_length, polyorder)
 
-    # Group delay (seconds)
-    group_delay = -dphi_df / (2 * np.pi)
+    np.subtract(phase[2:], phase[:-2], out=group_delay[1:-1])
+    np.multiply(group_delay[1:-1], 0.5 * scale, out=group_delay[1:-1])
+    group_delay[0] = (phase[1] - phase[0]) * scale
+    group_delay[-1] = (phase[-1] - phase[-2]) * scale
 
     return freqs, group_delay
 
 
+# ============================================================================
+# INTERPRETATION GUIDE
+# ============================================================================
+# Use these guidelines to understand what the metrics mean:
+#
+# PROMINENCE:
+#   - < 2.0: Weak periodicity (noise, unvoiced sounds)
+#   - 2.0-5.0: Moderate periodicity (could be speech or music)
+#   - > 5.0: Strong periodicity (voiced speech, tonal music)
+#
+# ENTROPY:
+#   - < 3.0: Very structured (pure tones, synthetic)
+#   - 3.0-6.0: Moderate structure (some speech/music)
+#   - 6.0-9.5: Balanced (natural speech, complex music)
+#   - > 9.5: High disorder (noise, unvoiced)
+#
+# FLATNESS:
+#   - Close to 0: Energy concentrated (tonal)
+#   - 0.2-0.4: Moderate distribution (typical speech)
+#   - > 0.5: Very uniform (noise-like)
+#
+# HARMONICITY_MEAN:
+#   - < 0.3: Weak harmonics (likely not speech)
+#   - 0.3-0.6: Moderate harmonics (could be speech/music)
+#   - > 0.6: Strong harmonics (voiced speech/music)
+#
+# VOICED_RATIO:
+#   - < 0.3: Mostly unvoiced (noise, whispers)
+#   - 0.3-0.7: Mixed (typical natural speech)
+#   - > 0.7: Mostly voiced (sustained tones, singing)
+#
+# PITCH_STD:
+#   - ≈ 0: Constant pitch (synthetic, monotone)
+#   - 5-30 Hz: Moderate variation (natural speech)
+#   - > 30 Hz: High variation (expressive speech, music)
+# ============================================================================
+# Per-metric (thresholds, messages): messages[i] applies when the value lies
+# between thresholds[i-1] (inclusive) and thresholds[i] (exclusive)
+_TABLES = {
+    "prominence": (
+        (2.0, 5.0),
+        (
+            "Weak periodicity (noise, unvoiced sounds)",
+            "Moderate periodicity (could be speech or music)",
+            "Strong periodicity (voiced speech, tonal music)",
+        ),
+    ),
+    "entropy": (
+        (3.0, 6.0, 9.5),
+        (
+            "Very structured (pure tones, synthetic)",
+            "Moderate structure (some speech/music)",
+            "Balanced (natural speech, complex music)",
+            "High disorder (noise, unvoiced)",
+        ),
+    ),
+    "flatness": (
+        (0.2, 0.4),
+        (
+            "Energy concentrated (tonal)",
+            "Moderate distribution (typical speech)",
+            "Very uniform (noise-like)",
+        ),
+    ),
+    "harmonicity_mean": (
+        (0.3, 0.6),
+        (
+            "Weak harmonics (likely not speech)",
+            "Moderate harmonics (could be speech/music)",
+            "Mostly voiced (sustained tones, singing)",
+        ),
+    ),
+    "voiced_ratio": (
+        (0.3, 0.7),
+        (
+            "Mostly unvoiced (noise, whispers)",
+            "Mixed (typical natural speech)",
+            "Mostly voiced (sustained tones, singing)",
+        ),
+    ),
+    "pitch_std": (
+        (5.0, 30.0),
+        (
+            "Constant pitch (synthetic, monotone)",
+            "Moderate variation (natural speech)",
+            "High variation (expressive speech, music)",
+        ),
+    ),
+}
+
+
 def interpret_signal(value, metric_type):
-    # ============================================================================
-    # INTERPRETATION GUIDE
-    # ============================================================================
-    # Use these guidelines to understand what the metrics mean:
-    #
-    # PROMINENCE:
-    #   - < 2.0: Weak periodicity (noise, unvoiced sounds)
-    #   - 2.0-5.0: Moderate periodicity (could be speech or music)
-    #   - > 5.0: Strong periodicity (voiced speech, tonal music)
-    #
-    # ENTROPY:
-    #   - < 3.0: Very structured (pure tones, synthetic)
-    #   - 3.0-6.0: Moderate structure (some speech/music)
-    #   - 6.0-9.5: Balanced (natural speech, complex music)
-    #   - > 9.5: High disorder (noise, unvoiced)
-    #
-    # FLATNESS:
-    #   - Close to 0: Energy concentrated (tonal)
-    #   - 0.2-0.4: Moderate distribution (typical speech)
-    #   - > 0.5: Very uniform (noise-like)
-    #
-    # HARMONICITY_MEAN:
-    #   - < 0.3: Weak harmonics (likely not speech)
-    #   - 0.3-0.6: Moderate harmonics (could be speech/music)
-    #   - > 0.6: Strong harmonics (voiced speech/music)
-    #
-    # VOICED_RATIO:
-    #   - < 0.3: Mostly unvoiced (noise, whispers)
-    #   - 0.3-0.7: Mixed (typical natural speech)
-    #   - > 0.7: Mostly voiced (sustained tones, singing)
-    #
-    # PITCH_STD:
-    #   - ≈ 0: Constant pitch (synthetic, monotone)
-    #   - 5-30 Hz: Moderate variation (natural speech)
-    #   - > 30 Hz: High variation (expressive speech, music)
-    # ============================================================================
-    output_text = ''
-    match metric_type:
-        case "prominence":
-            if value < 2.0:
-                output_text = "Weak periodicity (noise, unvoiced sounds)"
-            elif 2.0 <= value < 5:
-                output_text = "Moderate periodicity (could be speech or music)"
-            else:
-                output_text = "Strong periodicity (voiced speech, tonal music)"
-        case "entropy":
-            if value < 3.0:
-                output_text = "Very structured (pure tones, synthetic)"
-            elif 3.0 <= value < 6:
-                output_text = "Moderate structure (some speech/music)"
-            elif 6.0 <= value < 9.5:
-                output_text = "Balanced (natural speech, complex music)"
-            else:
-                output_text = "High disorder (noise, unvoiced)"
-        case "flatness":
-            if value < 0.2:
-                output_text = "Energy concentrated (tonal)"
-            elif 0.2 <= value < 0.4:
-                output_text = "Moderate distribution (typical speech)"
-            else:
-                output_text = "Very uniform (noise-like)"
-        case "harmonicity_mean":
-            if value < 0.3:
-                output_text = "Weak harmonics (likely not speech)"
-            elif 0.3 <= value < 0.6:
-                output_text = "Moderate harmonics (could be speech/music)"
-            else:
-                output_text = "Mostly voiced (sustained tones, singing)"
-        case "voiced_ratio":
-            if value < 0.3:
-                output_text = "Mostly unvoiced (noise, whispers)"
-            elif 0.3 <= value < 0.7:
-                output_text = "Mixed (typical natural speech)"
-            else:
-                output_text = "Mostly voiced (sustained tones, singing)"
-        case "pitch_std":
-            if value < 5:
-                output_text = "Constant pitch (synthetic, monotone)"
-            elif 5 <= value < 30:
-                output_text = "Moderate variation (natural speech)"
-            else:
-                output_text = "High variation (expressive speech, music)"
-
-    return output_text
+    """
+    Describe a metric value in words (see the interpretation guide above).
+
+    Returns an empty string for an unknown metric_type.
+    """
+    table = _TABLES.get(metric_type)
+    if table is None:
+        return ''
+    thresholds, messages = table
+    return messages[bisect.bisect_right(thresholds, value)]
+
+
+def interpret_signal_batch(values, metric_type):
+    """
+    Vectorized interpret_signal over an array of values of one metric.
+
+    Returns:
+    --------
+    numpy array of str
+        One description per value, same shape as values
+    """
+    values = np.asarray(values)
+    table = _TABLES.get(metric_type)
+    if table is None:
+        return np.full(values.shape, '')
+    thresholds, messages = table
+    idx = np.searchsorted(thresholds, values, side='right')
+    return np.asarray(messages)[idx]
+
+
+# Dense form of _TABLES for interpret_feature_matrix: metric i uses the first
+# _N_THR[i] entries of _THR[i] (padded with +inf) and _MESSAGES[i]. The extra
+# last row stands for unknown metrics and always maps to ''
+_METRIC_IDS = {name: i for i, name in enumerate(_TABLES)}
+_N_THR = np.array([len(thr) for thr, _ in _TABLES.values()] + [0], dtype=np.int64)
+_THR = np.full((len(_TABLES) + 1, _N_THR.max()), np.inf)
+_MESSAGES = np.full((len(_TABLES) + 1, _N_THR.max() + 1), '', dtype=object)
+for _i, (_thr, _msgs) in enumerate(_TABLES.values()):
+    _THR[_i, :len(_thr)] = _thr
+    _MESSAGES[_i, :len(_msgs)] = _msgs
+del _i, _thr, _msgs
+
+
+@njit(parallel=True, cache=True)
+def _interpret_batch(values, metric_ids, thresholds, n_thresholds, out_idx):
+    """Message index per value, same rule as bisect.bisect_right."""
+    for i in prange(values.size):
+        m = metric_ids[i]
+        v = values[i]
+        j = 0
+        while j < n_thresholds[m] and not v < thresholds[m, j]:
+            j += 1
+        out_idx[i] = j
+
+
+def interpret_feature_matrix(values, metric_types):
+    """
+    interpret_signal over a framewise feature matrix, in parallel.
+
+    Parameters:
+    -----------
+    values : numpy array
+        Metric values, e.g. shape (frames, metrics)
+    metric_types : str or sequence of str
+        Metric name(s), broadcast against values; for a (frames, metrics)
+        matrix pass one name per column
+
+    Returns:
+    --------
+    numpy array of str
+        One description per value, same shape as values ('' for unknown
+        metric names)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    unknown = len(_TABLES)
+    names = np.asarray(metric_types, dtype=object)
+    ids = np.array([_METRIC_IDS.get(name, unknown) for name in names.ravel()], dtype=np.int64)
+    ids = np.broadcast_to(ids.reshape(names.shape), values.shape).ravel()
+
+    idx = np.empty(values.size, dtype=np.int64)
+    _interpret_batch(np.ascontiguousarray(values).ravel(), ids, _THR, _N_THR, idx)
+    return _MESSAGES[ids, idx].astype(str).reshape(values.shape)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from scipy.signal import savgol_filter
+
+from files.utilities import _savgol_smooth, compute_group_delay, generate_tone
+
+
+# Above 10k bins _savgol_smooth switches to FFT convolution
+@pytest.mark.parametrize("n", [10_001, 50_000])
+@pytest.mark.parametrize("window_length, polyorder", [(11, 3), (101, 3), (10, 2), (100, 3)])
+def test_savgol_smooth_matches_savgol_filter(n, window_length, polyorder):
+    x = np.cumsum(np.random.default_rng(0).standard_normal(n))
+    expected = savgol_filter(x, window_length, polyorder)
+    np.testing.assert_allclose(_savgol_smooth(x, window_length, polyorder), expected,
+                               rtol=0, atol=1e-9 * np.abs(x).max())
+
+
+@pytest.mark.parametrize("window_length", [10, 101])
+def test_group_delay_matches_reference(window_length):
+    audio = np.random.default_rng(1).standard_normal(40_000)
+    sr = 16000
+    freqs, group_delay = compute_group_delay(audio, sr, window_length=window_length,
+                                             pad_to_fast_len=False)
+
+    phase = savgol_filter(np.unwrap(np.angle(np.fft.rfft(audio))), window_length, 3)
+    expected = -np.gradient(phase, np.fft.rfftfreq(len(audio), d=1 / sr)) / (2 * np.pi)
+    np.testing.assert_allclose(group_delay, expected, rtol=0, atol=1e-9 * np.abs(expected).max())
+
+
+@pytest.mark.parametrize("freq, amplitude", [
+    (440, 0.5),
+    (440, np.linspace(0, 1, 16000)),  # envelope
+    (np.linspace(100, 200, 16000), 0.5),  # per-sample frequency
+])
+def test_generate_tone_matches_sine(freq, amplitude):
+    t, signal = generate_tone(freq, 1.0, sr=16000, amplitude=amplitude)
+    np.testing.assert_allclose(signal, amplitude * np.sin(2 * np.pi * freq * t), rtol=0, atol=1e-9)